@@ -0,0 +1,85 @@
+import json
+import pickle
+import sys
+import time
+from lexical.scanner import Scanner
+from lexical.token_class import Token
+from lexical.token_stream import TokenStreamWriter, TokenStreamReader
+from util.token_type import TokenType
+
+# Compara o formato binário de tokens com pickle e JSON:
+# tamanho serializado e vazão de codificação/decodificação (MB/s).
+# A vazão é calculada sobre o tamanho do código-fonte, para que os
+# três formatos sejam comparados na mesma base.
+
+REPETICOES = 200
+
+
+def _tokens_de(filename: str) -> list[Token]:
+    sc = Scanner(filename)
+    tokens = []
+    token = sc.next_token()
+    while token is not None:
+        tokens.append(token)
+        token = sc.next_token()
+    return tokens
+
+
+def _encode_binario(tokens):
+    writer = TokenStreamWriter()
+    for token in tokens:
+        writer.write(token)
+    return writer.getvalue()
+
+
+def _decode_binario(data):
+    return list(TokenStreamReader(data))
+
+
+def _encode_json(tokens):
+    return json.dumps([[t.type.value, t.text, t.line, t.col] for t in tokens]).encode("utf-8")
+
+
+def _decode_json(data):
+    return [Token(TokenType(c), text, line, col) for c, text, line, col in json.loads(data)]
+
+
+def _encode_pickle(tokens):
+    return pickle.dumps(tokens, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_pickle(data):
+    return pickle.loads(data)
+
+
+def _medir(func, arg) -> float:
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        func(arg)
+    return (time.perf_counter() - inicio) / REPETICOES
+
+
+def main():
+    filename = sys.argv[1] if len(sys.argv) > 1 else "programa_ckp2_qui_noite.mc"
+    tokens = _tokens_de(filename)
+    with open(filename, 'rb') as f:
+        mb = len(f.read()) / 1_000_000
+
+    formatos = [
+        ("binario", _encode_binario, _decode_binario),
+        ("pickle", _encode_pickle, _decode_pickle),
+        ("json", _encode_json, _decode_json),
+    ]
+
+    print(f"--- Benchmark do fluxo de tokens: '{filename}' ({len(tokens)} tokens) ---")
+    print(f"{'formato':<10}{'bytes':>10}{'encode MB/s':>14}{'decode MB/s':>14}")
+    for nome, encode, decode in formatos:
+        data = encode(tokens)
+        assert decode(data) == tokens, f"Falha na ida e volta do formato {nome}"
+        t_enc = _medir(encode, tokens)
+        t_dec = _medir(decode, data)
+        print(f"{nome:<10}{len(data):>10}{mb / t_enc:>14.2f}{mb / t_dec:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+from util.token_type import TokenType
+from .token_class import Token
+
+# Formato binário do fluxo de tokens (versão 1):
+#
+#   cabeçalho      : MAGIC (4 bytes) + VERSION (1 byte)
+#   tabela lexemas : varint(qtd) + qtd * (varint(len) + bytes UTF-8)
+#   tokens         : varint(qtd) + qtd * registro
+#   registro       : varint(tipo) varint(índice do lexema)
+#                    zigzag(delta da linha) zigzag(coluna)
+#
+# A coluna é codificada como delta da coluna anterior quando o token está
+# na mesma linha do anterior, e como valor absoluto quando a linha muda.
+# Lexemas repetidos (ex: ';', nomes de variáveis) são gravados uma única vez.
+
+MAGIC = b"MCTK"
+VERSION = 1
+
+# Tabela de decodificação: código (TokenType.value) -> TokenType
+_TYPE_BY_CODE = {t.value: t for t in TokenType}
+
+
+def _write_varint(out: bytearray, value: int):
+    """Grava um inteiro não negativo em base 128 (7 bits por byte)."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    """Mapeia inteiros com sinal para não negativos (0, -1, 1, -2, ...)."""
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+class TokenStreamWriter:
+    """Serializa uma sequência de tokens no formato binário compacto."""
+
+    def __init__(self):
+        self._strings: dict[str, int] = {}
+        self._records = bytearray()
+        self._count = 0
+        self._prev_line = 0
+        self._prev_col = 0
+
+    def write(self, token: Token):
+        """Adiciona um token ao fluxo."""
+        index = self._strings.get(token.text)
+        if index is None:
+            index = len(self._strings)
+            self._strings[token.text] = index
+
+        out = self._records
+        _write_varint(out, token.type.value)
+        _write_varint(out, index)
+
+        delta_line = token.line - self._prev_line
+        _write_varint(out, _zigzag(delta_line))
+        if delta_line == 0:
+            _write_varint(out, _zigzag(token.col - self._prev_col))
+        else:
+            _write_varint(out, _zigzag(token.col))
+
+        self._prev_line = token.line
+        self._prev_col = token.col
+        self._count += 1
+
+    def write_scanner(self, scanner) -> int:
+        """Consome o Scanner até o fim e grava todos os tokens. Retorna a quantidade gravada."""
+        count = 0
+        token = scanner.next_token()
+        while token is not None:
+            self.write(token)
+            count += 1
+            token = scanner.next_token()
+        return count
+
+    def getvalue(self) -> bytes:
+        """Retorna o fluxo completo (cabeçalho, tabela de lexemas e tokens)."""
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+
+        _write_varint(out, len(self._strings))
+        # dict preserva a ordem de inserção, que é a ordem dos índices
+        for text in self._strings:
+            data = text.encode("utf-8")
+            _write_varint(out, len(data))
+            out += data
+
+        _write_varint(out, self._count)
+        out += self._records
+        return bytes(out)
+
+
+class TokenStreamReader:
+    """
+    Lê um fluxo gerado pelo TokenStreamWriter sem copiar o buffer.
+    Expõe next_token(), podendo substituir o Scanner no Parser.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        self._buf = memoryview(data).cast("B")
+        self.pos = 0
+
+        if len(self._buf) < 5 or bytes(self._buf[:4]) != MAGIC:
+            raise ValueError("Fluxo de tokens inválido: assinatura não reconhecida.")
+        if self._buf[4] != VERSION:
+            raise ValueError(f"Fluxo de tokens inválido: versão {self._buf[4]} não suportada.")
+        self.pos = 5
+
+        # Tabela de lexemas: cada string é decodificada direto de uma fatia do memoryview
+        self._strings: list[str] = []
+        for _ in range(self._read_varint()):
+            length = self._read_varint()
+            end = self.pos + length
+            if end > len(self._buf):
+                raise ValueError("Fluxo de tokens inválido: tabela de lexemas truncada.")
+            self._strings.append(str(self._buf[self.pos:end], "utf-8"))
+            self.pos = end
+
+        self._remaining = self._read_varint()
+        self._line = 0
+        self._col = 0
+
+    def _read_varint(self) -> int:
+        buf = self._buf
+        pos = self.pos
+        # Caminho rápido: quase todos os valores cabem em um único byte
+        if pos < len(buf) and buf[pos] < 0x80:
+            self.pos = pos + 1
+            return buf[pos]
+        result = 0
+        shift = 0
+        try:
+            while True:
+                byte = buf[pos]
+                pos += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+        except IndexError:
+            raise ValueError("Fluxo de tokens inválido: dados truncados.") from None
+        self.pos = pos
+        return result
+
+    def next_token(self) -> Token | None:
+        if self._remaining == 0:
+            return None
+        self._remaining -= 1
+
+        code = self._read_varint()
+        token_type = _TYPE_BY_CODE.get(code)
+        if token_type is None:
+            raise ValueError(f"Fluxo de tokens inválido: tipo de token desconhecido ({code}).")
+        text = self._strings[self._read_varint()]
+
+        delta_line = _unzigzag(self._read_varint())
+        col = _unzigzag(self._read_varint())
+        if delta_line == 0:
+            col += self._col
+        self._line += delta_line
+        self._col = col
+
+        return Token(token_type, text, self._line, col)
+
+    def __iter__(self):
+        token = self.next_token()
+        while token is not None:
+            yield token
+            token = self.next_token()